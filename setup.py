@@ -200,7 +200,8 @@ setup(
         "pyglet==1.5.27",
         "matplotlib",
         "numpy>=1.15",
-        "torch>=1.4.0",
+        "packaging",
+        "torch>=1.13.0",
         "tqdm",
         "scikit-learn>=0.21.2",
         "seals>=0.1.5",
@@ -492,9 +492,18 @@ def rollout_stats(
     """
     assert len(trajectories) > 0
     out_stats: Dict[str, float] = {"n_traj": len(trajectories)}
+    # Sum the rewards of all trajectories in one vectorized pass over their
+    # concatenation, rather than one Python-level sum per trajectory.
+    traj_lens = np.fromiter(
+        (len(t.rews) for t in trajectories),
+        dtype=np.int64,
+        count=len(trajectories),
+    )
+    traj_starts = np.concatenate([[0], np.cumsum(traj_lens)[:-1]])
+    all_rews = np.concatenate([t.rews for t in trajectories])
     traj_descriptors = {
-        "return": np.asarray([sum(t.rews) for t in trajectories]),
-        "len": np.asarray([len(t.rews) for t in trajectories]),
+        "return": np.add.reduceat(all_rews, traj_starts),
+        "len": traj_lens,
     }
 
     monitor_ep_returns = []
@@ -1,10 +1,21 @@
 """Implements the regularizer base class and some standard regularizers."""
 
 import abc
-from typing import Generic, Optional, Protocol, Type, TypeVar, Union
+from typing import (
+    Generic,
+    List,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 import numpy as np
 import torch as th
+from packaging import version
 from torch import optim
 
 from imitation.regularization import updaters
@@ -13,6 +24,9 @@ from imitation.util import logger as imit_logger
 # this is not actually a scalar, dimension check is still required for tensor.
 Scalar = Union[th.Tensor, float]
 
+# Gradients through the multi-tensor (foreach) ops are only supported from torch 2.1.
+_FOREACH_AUTOGRAD = version.parse(th.__version__).release >= (2, 1)
+
 R = TypeVar("R")
 Self = TypeVar("Self", bound="Regularizer")
 T_Regularizer_co = TypeVar(  # pytype: disable=not-supported-yet
@@ -130,6 +144,10 @@ class Regularizer(abc.ABC, Generic[R]):
         self.logger = logger
         self.val_split = val_split
 
+        if lambda_updater is None:
+            # Lambda stays constant, so skip the update entirely.
+            self.update_params = self._skip_update_params  # type: ignore[assignment]
+
         self.logger.record("regularization_lambda", self.lambda_)
 
     @classmethod
@@ -191,6 +209,10 @@ class Regularizer(abc.ABC, Generic[R]):
             self.lambda_ = self.lambda_updater(self.lambda_, train_loss, val_loss)
             self.logger.record("regularization_lambda", self.lambda_)
 
+    def _skip_update_params(self, train_loss: Scalar, val_loss: Scalar) -> None:
+        """Replaces `update_params` when there is no lambda updater."""
+        del train_loss, val_loss
+
 
 class LossRegularizer(Regularizer[Scalar]):
     """Abstract base class for regularizers that add a loss term to the loss function.
@@ -198,6 +220,40 @@ class LossRegularizer(Regularizer[Scalar]):
     Requires the user to implement the _loss_penalty method.
     """
 
+    log_every: int
+
+    def __init__(
+        self,
+        optimizer: optim.Optimizer,
+        initial_lambda: float,
+        lambda_updater: Optional[updaters.LambdaUpdater],
+        logger: imit_logger.HierarchicalLogger,
+        val_split: Optional[float] = None,
+        log_every: int = 1,
+    ) -> None:
+        """Initialize the regularizer.
+
+        Args:
+            optimizer: The optimizer to which the regularizer is attached.
+            initial_lambda: The initial value of the regularization parameter.
+            lambda_updater: A callable object that takes in the current lambda and
+                the train and val loss, and returns the new lambda.
+            logger: The logger to which the regularizer will log its parameters.
+            val_split: The fraction of the training data to use as validation data
+                for the lambda updater. Can be none if no lambda updater is provided.
+            log_every: Log the regularized loss only every ``log_every`` calls to
+                ``regularize_and_backward``. Logging reads the loss back from the
+                device, which forces a synchronization.
+
+        Raises:
+            ValueError: if ``log_every`` is not a positive integer.
+        """
+        super().__init__(optimizer, initial_lambda, lambda_updater, logger, val_split)
+        if not isinstance(log_every, int) or log_every < 1:
+            raise ValueError("log_every must be a positive integer")
+        self.log_every = log_every
+        self._num_regularize_calls = 0
+
     @abc.abstractmethod
     def _loss_penalty(self, loss: Scalar) -> Scalar:
         """Implement this method to add a loss term to the loss function.
@@ -212,15 +268,23 @@ class LossRegularizer(Regularizer[Scalar]):
     def regularize_and_backward(self, loss: th.Tensor) -> Scalar:
         """Add the regularization term to the loss and compute gradients.
 
+        If the regularization strength ``lambda_`` is zero, the penalty is skipped
+        and the loss is returned unchanged.
+
         Args:
             loss: The loss to regularize.
 
         Returns:
             The regularized loss.
         """
-        regularized_loss = th.add(loss, self._loss_penalty(loss))
+        if self.lambda_ == 0.0:
+            regularized_loss = loss
+        else:
+            regularized_loss = th.add(loss, self._loss_penalty(loss))
         regularized_loss.backward()
-        self.logger.record("regularized_loss", regularized_loss.item())
+        if self._num_regularize_calls % self.log_every == 0:
+            self.logger.record("regularized_loss", regularized_loss.item())
+        self._num_regularize_calls += 1
         return regularized_loss
 
 
@@ -243,8 +307,17 @@ class WeightRegularizer(Regularizer):
         """
 
     def regularize_and_backward(self, loss: th.Tensor) -> None:
-        """Regularize the weights of the network, and call ``loss.backward()``."""
+        """Regularize the weights of the network, and call ``loss.backward()``.
+
+        The weights are left unchanged if the regularization strength ``lambda_``
+        is zero.
+
+        Args:
+            loss: The loss to call ``backward()`` on.
+        """
         loss.backward()
+        if self.lambda_ == 0.0:
+            return
         for group in self.optimizer.param_groups:
             for param in group["params"]:
                 param.data = th.add(param.data, self._weight_penalty(param, group))
@@ -263,12 +336,40 @@ class LpRegularizer(LossRegularizer):
         logger: imit_logger.HierarchicalLogger,
         p: int,
         val_split: Optional[float] = None,
+        log_every: int = 1,
     ) -> None:
         """Initialize the regularizer."""
-        super().__init__(optimizer, initial_lambda, lambda_updater, logger, val_split)
+        super().__init__(
+            optimizer,
+            initial_lambda,
+            lambda_updater,
+            logger,
+            val_split,
+            log_every,
+        )
         if not isinstance(p, int) or p < 1:
             raise ValueError("p must be a positive integer")
         self.p = p
+        self._params: List[th.Tensor] = []
+        self._params_key: Optional[Tuple[int, int]] = None
+
+    def _flat_params(self) -> List[th.Tensor]:
+        """Returns the parameters of all groups of the optimizer as a flat list.
+
+        The list is cached, and only rebuilt when parameter groups are added or the
+        optimizer's ``param_groups`` are replaced.
+
+        Returns:
+            The parameters of the optimizer.
+        """
+        param_groups = self.optimizer.param_groups
+        key = (id(param_groups), len(param_groups))
+        if key != self._params_key:
+            self._params = [
+                param for group in param_groups for param in group["params"]
+            ]
+            self._params_key = key
+        return self._params
 
     def _loss_penalty(self, loss: Scalar) -> Scalar:
         """Returns the loss penalty.
@@ -283,10 +384,24 @@ class LpRegularizer(LossRegularizer):
             The scaled pth power of the Lp norm of the network weights.
         """
         del loss
-        penalty = 0
-        for group in self.optimizer.param_groups:
-            for param in group["params"]:
-                penalty += th.linalg.vector_norm(param, ord=self.p).pow(self.p)
+        params = self._flat_params()
+        if not _FOREACH_AUTOGRAD:
+            penalty = sum(
+                th.linalg.vector_norm(param, ord=self.p).pow(self.p) for param in params
+            )
+            return self.lambda_ * penalty
+        # The p-th power of the Lp norm is the sum of |x|^p, which is the L1 norm
+        # of x^p. Computing it directly avoids taking a p-th root only to raise the
+        # result back to the p-th power. The multi-tensor (foreach) kernels process
+        # all parameters at once rather than launching one kernel per parameter.
+        powers: Sequence[th.Tensor]
+        if self.p == 1:
+            powers = params
+        elif self.p == 2:
+            powers = th._foreach_mul(params, params)
+        else:
+            powers = th._foreach_pow(params, self.p)
+        penalty = th.stack(th._foreach_norm(powers, 1)).sum()
         return self.lambda_ * penalty
 
 
@@ -304,3 +419,20 @@ class WeightDecayRegularizer(WeightRegularizer):
             The weight penalty (to add to the current value of the weight)
         """
         return -self.lambda_ * group["lr"] * weight.data
+
+    def regularize_and_backward(self, loss: th.Tensor) -> None:
+        """Decay the weights of the network, and call ``loss.backward()``.
+
+        Adding the weight penalty amounts to scaling each weight by
+        ``1 - lambda_ * lr``, so this is done in-place for all parameters of a group
+        at once instead of adding the penalty to each parameter individually.
+
+        Args:
+            loss: The loss to call ``backward()`` on.
+        """
+        loss.backward()
+        if self.lambda_ == 0.0:
+            return
+        with th.no_grad():
+            for group in self.optimizer.param_groups:
+                th._foreach_mul_(group["params"], 1.0 - self.lambda_ * group["lr"])
@@ -114,6 +114,14 @@ class IntervalParamScaler(LambdaUpdater):
             raise ValueError("lambda_ must be non-negative")
         if not isinstance(lambda_, float):
             raise ValueError("lambda_ must be a float")
+
+        # Convert the losses to Python floats once, so that the comparisons below
+        # don't each force a device synchronization for tensor losses.
+        if isinstance(train_loss, th.Tensor):
+            train_loss = train_loss.item()
+        if isinstance(val_loss, th.Tensor):
+            val_loss = val_loss.item()
+
         if train_loss < 0 or val_loss < 0:
             raise ValueError("losses must be non-negative for this updater")
 
@@ -126,8 +134,8 @@ class IntervalParamScaler(LambdaUpdater):
             return lambda_ * (1 + self.scaling_factor)
 
         val_to_train_ratio = val_loss / train_loss
-        if val_to_train_ratio > self.tolerable_interval[1]:
-            lambda_ *= 1 + self.scaling_factor
-        elif val_to_train_ratio < self.tolerable_interval[0]:
-            lambda_ *= 1 - self.scaling_factor
-        return lambda_
+        # +1 above the tolerable interval, -1 below it and 0 inside it.
+        direction = int(val_to_train_ratio > self.tolerable_interval[1]) - int(
+            val_to_train_ratio < self.tolerable_interval[0],
+        )
+        return lambda_ * (1 + direction * self.scaling_factor)
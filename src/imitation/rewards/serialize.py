@@ -1,6 +1,19 @@
 """Load serialized reward functions of different types."""
 
-from typing import Any, Callable, Dict, Iterable, Optional, Sequence, Type, Union, cast
+import functools
+import os
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 
 import numpy as np
 import torch as th
@@ -16,6 +29,15 @@ RewardFnLoaderFn = Callable[[str, VecEnv], reward_function.RewardFn]
 
 reward_registry: registry.Registry[RewardFnLoaderFn] = registry.Registry()
 
+# Whether loaded reward functions should check the shape of the rewards they return.
+# Off by default as the check runs on every environment step; set the environment
+# variable IMITATION_DEBUG_REWARD=1 to enable it.
+_DEBUG_REWARD_SHAPE = os.getenv("IMITATION_DEBUG_REWARD", "").strip().lower() in (
+    "1",
+    "true",
+    "yes",
+)
+
 
 class ValidateRewardFn(reward_function.RewardFn):
     """Wrap reward function to add sanity check.
@@ -47,6 +69,21 @@ class ValidateRewardFn(reward_function.RewardFn):
         return rew
 
 
+def _validate_reward(reward_fn: reward_function.RewardFn) -> reward_function.RewardFn:
+    """Wraps `reward_fn` in `ValidateRewardFn` if reward shape debugging is enabled.
+
+    Args:
+        reward_fn: the reward function to validate.
+
+    Returns:
+        `reward_fn` wrapped in `ValidateRewardFn` if `_DEBUG_REWARD_SHAPE` is set,
+        otherwise `reward_fn` unchanged.
+    """
+    if _DEBUG_REWARD_SHAPE:
+        return ValidateRewardFn(reward_fn)
+    return reward_fn
+
+
 def _strip_wrappers(
     reward_net: reward_nets.RewardNet,
     wrapper_types: Iterable[Type[reward_nets.RewardNetWrapper]],
@@ -84,10 +121,13 @@ def _make_functional(
     default_kwargs: Optional[Dict[str, Any]] = None,
     **kwargs: Any,
 ) -> reward_function.RewardFn:
-    if default_kwargs is None:
-        default_kwargs = {}
-    default_kwargs.update(kwargs)
-    return lambda *args: getattr(net, attr)(*args, **default_kwargs)
+    # Resolve the method and merge the keyword arguments once, rather than on
+    # every call to the returned reward function.
+    fn = getattr(net, attr)
+    merged_kwargs = {**(default_kwargs or {}), **kwargs}
+    if merged_kwargs:
+        return functools.partial(fn, **merged_kwargs)
+    return fn
 
 
 WrapperPrefix = Sequence[Type[reward_nets.RewardNet]]
@@ -95,21 +135,31 @@ WrapperPrefix = Sequence[Type[reward_nets.RewardNet]]
 
 def _prefix_matches(wrappers: Sequence[Type[Any]], prefix: Sequence[Type[Any]]) -> bool:
     """Return true if `prefix` is a prefix of `wrappers`."""
-    # Base cases
-    if len(prefix) == 0:
-        # If we run out of prefix before running out of wrappers
-        return True
-    elif len(wrappers) == 0:
+    if len(prefix) > len(wrappers):
         # If we run out of wrappers before we run out of prefix
         return False
+    return all(issubclass(w, p) for w, p in zip(wrappers, prefix))
 
-    prefix_head, *prefix_tail = prefix
-    wrappers_head, *wrappers_tail = wrappers
 
-    if not issubclass(wrappers_head, prefix_head):
-        return False
+def _wrapper_chain(
+    reward_net: Union[reward_nets.RewardNet, reward_nets.RewardNetWrapper],
+) -> Tuple[Type[reward_nets.RewardNet], ...]:
+    """Returns the classes of `reward_net` and its bases, from outermost to innermost.
 
-    return _prefix_matches(wrappers_tail, prefix_tail)
+    Args:
+        reward_net: a reward network that may be wrapped.
+
+    Returns:
+        A tuple of the class of each wrapper, followed by the class of the final
+        (unwrapped) reward net.
+    """
+    chain: List[Type[reward_nets.RewardNet]] = []
+    net = reward_net
+    while isinstance(net, reward_nets.RewardNetWrapper):
+        chain.append(type(net))
+        net = net.base
+    chain.append(type(net))  # append the final reward net
+    return tuple(chain)
 
 
 def _validate_wrapper_structure(
@@ -144,12 +194,7 @@ def _validate_wrapper_structure(
     >>> reward_net == _validate_wrapper_structure(reward_net, [[WrapperB, RewardNetA]]))
     True
     """
-    wrapper = reward_net
-    wrappers = []
-    while hasattr(wrapper, "base"):
-        wrappers.append(wrapper.__class__)
-        wrapper = cast(reward_nets.RewardNet, wrapper.base)
-    wrappers.append(wrapper.__class__)  # append the final reward net
+    wrappers = _wrapper_chain(reward_net)
 
     if any(_prefix_matches(wrappers, prefix) for prefix in prefixes):
         return reward_net
@@ -170,6 +215,12 @@ def _validate_wrapper_structure(
     )
 
 
+def _load_reward_net(path: str) -> reward_nets.RewardNet:
+    # The whole RewardNet is pickled, not just its weights, so it cannot be
+    # loaded with `weights_only=True` (the default in recent versions of PyTorch).
+    return th.load(str(path), weights_only=False)
+
+
 def load_zero(path: str, venv: VecEnv) -> reward_function.RewardFn:
     del path, venv
 
@@ -189,10 +240,10 @@ def load_zero(path: str, venv: VecEnv) -> reward_function.RewardFn:
 
 reward_registry.register(
     key="RewardNet_shaped",
-    value=lambda path, _, **kwargs: ValidateRewardFn(
+    value=lambda path, _, **kwargs: _validate_reward(
         _make_functional(
             _validate_wrapper_structure(
-                th.load(str(path)),
+                _load_reward_net(path),
                 {(reward_nets.ShapedRewardNet,)},
             ),
         ),
@@ -201,19 +252,19 @@ reward_registry.register(
 
 reward_registry.register(
     key="RewardNet_unshaped",
-    value=lambda path, _, **kwargs: ValidateRewardFn(
+    value=lambda path, _, **kwargs: _validate_reward(
         _make_functional(
-            _strip_wrappers(th.load(str(path)), (reward_nets.ShapedRewardNet,)),
+            _strip_wrappers(_load_reward_net(path), (reward_nets.ShapedRewardNet,)),
         ),
     ),
 )
 
 reward_registry.register(
     key="RewardNet_normalized",
-    value=lambda path, _, **kwargs: ValidateRewardFn(
+    value=lambda path, _, **kwargs: _validate_reward(
         _make_functional(
             _validate_wrapper_structure(
-                th.load(str(path)),
+                _load_reward_net(path),
                 {(reward_nets.NormalizedRewardNet,)},
             ),
             attr="predict_processed",
@@ -225,20 +276,20 @@ reward_registry.register(
 
 reward_registry.register(
     key="RewardNet_unnormalized",
-    value=lambda path, _, **kwargs: ValidateRewardFn(
+    value=lambda path, _, **kwargs: _validate_reward(
         _make_functional(
-            _strip_wrappers(th.load(str(path)), (reward_nets.NormalizedRewardNet,)),
+            _strip_wrappers(_load_reward_net(path), (reward_nets.NormalizedRewardNet,)),
         ),
     ),
 )
 
 reward_registry.register(
     key="RewardNet_std_added",
-    value=lambda path, _, **kwargs: ValidateRewardFn(
+    value=lambda path, _, **kwargs: _validate_reward(
         _make_functional(
             _strip_wrappers(
                 _validate_wrapper_structure(
-                    th.load(str(path)),
+                    _load_reward_net(path),
                     {
                         (reward_nets.AddSTDRewardWrapper,),
                         (
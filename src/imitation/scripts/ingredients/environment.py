@@ -61,6 +61,8 @@ def make_venv(
         max_episode_steps=max_episode_steps,
         log_dir=_run.config["logging"]["log_dir"] if "logging" in _run.config else None,
         env_make_kwargs=env_make_kwargs,
+        # Scripts own their process, so they can set the forkserver preload list.
+        forkserver_preload=True,
         **kwargs,
     )
     try:
@@ -108,6 +110,7 @@ def make_rollout_venv(
         log_dir=None,
         env_make_kwargs=env_make_kwargs,
         post_wrappers=[lambda env, i: wrappers.RolloutInfoWrapper(env)],
+        forkserver_preload=True,
     )
     try:
         yield venv
@@ -1,9 +1,9 @@
 """Runs a Sacred experiment in parallel."""
 
 import collections.abc
-import copy
+import functools
 import pathlib
-from typing import Any, Callable, Dict, Mapping, Optional, Sequence
+from typing import Any, Callable, Mapping, Optional, Sequence
 
 import ray
 import ray.tune
@@ -84,8 +84,8 @@ def parallel(
 
     # Convert Sacred's ReadOnlyDict (and recursively convert ReadOnlyContainer values)
     # to regular python variants because not picklable.
-    base_config_updates = copy.deepcopy(base_config_updates)
-    search_space = copy.deepcopy(search_space)
+    base_config_updates = _to_plain(base_config_updates)
+    search_space = _to_plain(search_space)
 
     trainable = _ray_tune_sacred_wrapper(
         sacred_ex_name,
@@ -108,6 +108,50 @@ def parallel(
         ray.shutdown()
 
 
+def _to_plain(obj: Any) -> Any:
+    """Recursively converts mappings and sequences to plain dicts, lists and tuples.
+
+    Unlike `copy.deepcopy`, only containers are rebuilt: all other values (e.g. Ray
+    Tune search objects or NumPy arrays) are kept by reference.
+
+    Args:
+        obj: The object to convert, e.g. a Sacred `ReadOnlyDict` or `ReadOnlyList`.
+
+    Returns:
+        `obj` with every mapping converted to a `dict`, every list to a `list` and
+        every tuple to a `tuple`.
+    """
+    if isinstance(obj, collections.abc.Mapping):
+        return {k: _to_plain(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_to_plain(v) for v in obj]
+    if isinstance(obj, tuple):
+        return tuple(_to_plain(v) for v in obj)
+    return obj
+
+
+@functools.lru_cache(maxsize=None)
+def _get_sacred_ex(sacred_ex_name: str) -> sacred.Experiment:
+    """Returns the Sacred experiment named `sacred_ex_name`, importing it once.
+
+    Args:
+        sacred_ex_name: Either "train_rl" or "train_adversarial".
+
+    Returns:
+        The corresponding Sacred experiment.
+    """
+    # Import inside function rather than in module because Sacred experiments
+    # are not picklable, and Ray requires the trainable function to be picklable.
+    from imitation.scripts.train_adversarial import train_adversarial_ex
+    from imitation.scripts.train_rl import train_rl_ex
+
+    experiments = {
+        "train_rl": train_rl_ex,
+        "train_adversarial": train_adversarial_ex,
+    }
+    return experiments[sacred_ex_name]
+
+
 def _ray_tune_sacred_wrapper(
     sacred_ex_name: str,
     run_name: str,
@@ -164,30 +208,18 @@ def _ray_tune_sacred_wrapper(
         # TODO(shwang): Stop modifying CAPTURE_MODE once the issue is fixed.
         sacred.SETTINGS.CAPTURE_MODE = "sys"
 
-        run_kwargs = config
-        updated_run_kwargs: Dict[str, Any] = {}
-        # Import inside function rather than in module because Sacred experiments
-        # are not picklable, and Ray requires this function to be picklable.
-        from imitation.scripts.train_adversarial import train_adversarial_ex
-        from imitation.scripts.train_rl import train_rl_ex
-
-        experiments = {
-            "train_rl": train_rl_ex,
-            "train_adversarial": train_adversarial_ex,
+        ex = _get_sacred_ex(sacred_ex_name)
+
+        # Apply base configs to get modified `named_configs` and `config_updates`,
+        # and pass all other run_kwargs items through unchanged.
+        run_kwargs = dict(config)
+        named_configs = base_named_configs + run_kwargs.pop("named_configs")
+        config_updates = {**base_config_updates, **run_kwargs.pop("config_updates")}
+        updated_run_kwargs = {
+            **run_kwargs,
+            "named_configs": named_configs,
+            "config_updates": config_updates,
         }
-        ex = experiments[sacred_ex_name]
-
-        # Apply base configs to get modified `named_configs` and `config_updates`.
-        named_configs = base_named_configs + run_kwargs["named_configs"]
-        updated_run_kwargs["named_configs"] = named_configs
-
-        config_updates = {**base_config_updates, **run_kwargs["config_updates"]}
-        updated_run_kwargs["config_updates"] = config_updates
-
-        # Add other run_kwargs items to updated_run_kwargs.
-        for k, v in run_kwargs.items():
-            if k not in updated_run_kwargs:
-                updated_run_kwargs[k] = v
 
         run = ex.run(
             **updated_run_kwargs,
@@ -1,19 +1,22 @@
 """Train GAIL or AIRL."""
 
 import functools
+import io
 import logging
+import os
 import pathlib
-from typing import Any, Mapping, Optional, Type
+from concurrent import futures
+from typing import Any, List, Mapping, Optional, Type
 
 import sacred.commands
 import torch as th
 from sacred.observers import FileStorageObserver
+from stable_baselines3.common import base_class
 
 from imitation.algorithms.adversarial import airl as airl_algo
 from imitation.algorithms.adversarial import common
 from imitation.algorithms.adversarial import gail as gail_algo
 from imitation.data import rollout
-from imitation.policies import serialize
 from imitation.scripts.config.train_adversarial import train_adversarial_ex
 from imitation.scripts.ingredients import demonstrations, environment
 from imitation.scripts.ingredients import logging as logging_ingredient
@@ -22,17 +25,129 @@ from imitation.scripts.ingredients import policy_evaluation, reward, rl
 logger = logging.getLogger("imitation.scripts.train_adversarial")
 
 
-def save(trainer: common.AdversarialTrainer, save_path: pathlib.Path):
-    """Save discriminator and generator."""
+def _write_atomic(path: pathlib.Path, data: bytes) -> None:
+    """Writes `data` to `path`, so that `path` is never left partially written."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def _serialize_policy(gen_algo: base_class.BaseAlgorithm) -> bytes:
+    """Serializes `gen_algo` in memory.
+
+    Written to `model.zip` in a policy directory, this gives the same layout as
+    `imitation.policies.serialize.save_stable_model`, so the policy can be loaded
+    with `imitation.policies.serialize.load_policy`.
+
+    Args:
+        gen_algo: The generator algorithm to serialize.
+
+    Returns:
+        The contents of the `model.zip` file.
+    """
+    buffer = io.BytesIO()
+    gen_algo.save(buffer)
+    return buffer.getvalue()
+
+
+def _check_finished_writes(writes: List[futures.Future]) -> List[futures.Future]:
+    """Re-raises errors of finished checkpoint writes.
+
+    Args:
+        writes: Futures of checkpoint writes.
+
+    Returns:
+        The writes that have not finished yet.
+    """
+    pending = []
+    for write in writes:
+        if write.done():
+            write.result()
+        else:
+            pending.append(write)
+    return pending
+
+
+def _link_policy(policy_path: pathlib.Path, checkpoint_path: pathlib.Path) -> bool:
+    """Hard-links the generator policy saved in `checkpoint_path` into `policy_path`.
+
+    Unlike a symlink, the hard link keeps the policy available if the checkpoint is
+    deleted later. Checkpoint files are only ever replaced, never modified in place,
+    so writing either checkpoint again does not affect the other.
+
+    Args:
+        policy_path: The policy directory to link the policy into.
+        checkpoint_path: A checkpoint directory written by `save`.
+
+    Returns:
+        True if the link was created, False if hard links are not supported here
+        (e.g. by the filesystem).
+    """
+    model_path = policy_path / "model.zip"
+    tmp_path = model_path.with_name(model_path.name + ".tmp")
+    try:
+        tmp_path.unlink(missing_ok=True)
+        os.link(checkpoint_path / "gen_policy" / "model.zip", tmp_path)
+        os.replace(tmp_path, model_path)
+    except OSError:
+        return False
+    return True
+
+
+def save(
+    trainer: common.AdversarialTrainer,
+    save_path: pathlib.Path,
+    executor: Optional[futures.Executor] = None,
+    policy_checkpoint_path: Optional[pathlib.Path] = None,
+) -> List[futures.Future]:
+    """Save discriminator and generator.
+
+    The models are serialized in memory first and then written to disk. If an
+    `executor` is provided, the writes are submitted to it, so that training can
+    continue while the files are being written. Each file is written to a temporary
+    file first and then renamed, so a crash never leaves a partial checkpoint file.
+
+    Args:
+        trainer: The trainer whose discriminator and generator to save.
+        save_path: The directory to save the models to.
+        executor: Executor to write the files on. If None, the files are written
+            before returning.
+        policy_checkpoint_path: A checkpoint directory previously written by `save`
+            whose generator policy is identical to the current one. If given, the
+            policy file is hard-linked from that checkpoint instead of being written
+            again (falling back to writing it if hard links are unsupported).
+
+    Returns:
+        Futures for the pending writes. Empty if `executor` is None.
+    """
     # We implement this here and not in Trainer since we do not want to actually
     # serialize the whole Trainer (including e.g. expert demonstrations).
-    save_path.mkdir(parents=True, exist_ok=True)
-    th.save(trainer.reward_train, save_path / "reward_train.pt")
-    th.save(trainer.reward_test, save_path / "reward_test.pt")
-    serialize.save_stable_model(
-        save_path / "gen_policy",
-        trainer.gen_algo,
-    )
+    policy_path = save_path / "gen_policy"
+    policy_path.mkdir(parents=True, exist_ok=True)
+
+    serialized = {}
+    for filename, reward_net in [
+        ("reward_train.pt", trainer.reward_train),
+        ("reward_test.pt", trainer.reward_test),
+    ]:
+        buffer = io.BytesIO()
+        # Tensor storages are already written as separate records of the zip
+        # archive; protocol 5 just gives a more compact pickle for the module.
+        th.save(reward_net, buffer, pickle_protocol=5)
+        serialized[save_path / filename] = buffer.getvalue()
+    if policy_checkpoint_path is None or not _link_policy(
+        policy_path,
+        policy_checkpoint_path,
+    ):
+        serialized[policy_path / "model.zip"] = _serialize_policy(trainer.gen_algo)
+
+    if executor is None:
+        for path, data in serialized.items():
+            _write_atomic(path, data)
+        return []
+    return [
+        executor.submit(_write_atomic, path, data) for path, data in serialized.items()
+    ]
 
 
 def _add_hook(ingredient: sacred.Ingredient) -> None:
@@ -81,6 +196,9 @@ def train_adversarial(
            `f"{log_dir}/checkpoints/{step}/reward_{train,test}.pt"`
             where step is either the training round or "final".
         - Generator policies are saved to `f"{log_dir}/checkpoints/{step}/gen_policy/"`.
+            If the last round was checkpointed, the final policy file is a hard link
+            to that round's, so it takes no extra disk space but remains valid if
+            the round's checkpoint is deleted.
 
     Args:
         show_config: Print the merged config before starting training. This is
@@ -153,20 +271,49 @@ def train_adversarial(
             **algorithm_kwargs,
         )
 
-        def callback(round_num: int, /) -> None:
-            if checkpoint_interval > 0 and round_num % checkpoint_interval == 0:
-                save(trainer, log_dir / "checkpoints" / f"{round_num:05d}")
-
-        trainer.train(total_timesteps, callback)
+        # Checkpoints are written in the background while training continues.
+        pending_writes: List[futures.Future] = []
+        # Checkpoint of the most recent round, if that round was checkpointed.
+        last_checkpoint_path: Optional[pathlib.Path] = None
+        with futures.ThreadPoolExecutor(max_workers=1) as save_executor:
+
+            def callback(round_num: int, /) -> None:
+                nonlocal last_checkpoint_path
+                # Fail early if writing an earlier checkpoint failed.
+                pending_writes[:] = _check_finished_writes(pending_writes)
+                last_checkpoint_path = None
+                if checkpoint_interval > 0 and round_num % checkpoint_interval == 0:
+                    last_checkpoint_path = log_dir / "checkpoints" / f"{round_num:05d}"
+                    pending_writes.extend(
+                        save(trainer, last_checkpoint_path, executor=save_executor),
+                    )
+
+            trainer.train(total_timesteps, callback)
+        # Re-raise any errors that occurred while writing checkpoints.
+        for write in pending_writes:
+            write.result()
         imit_stats = policy_evaluation.eval_policy(trainer.policy, trainer.venv_train)
 
-    # Save final artifacts.
-    if checkpoint_interval >= 0:
-        save(trainer, log_dir / "checkpoints" / "final")
+    # Save final artifacts, computing the expert statistics while they are written.
+    # The generator is not updated after the last round, so if that round was
+    # checkpointed its policy is reused. The reward nets are always saved again,
+    # since evaluating the policy may update their normalization statistics.
+    with futures.ThreadPoolExecutor(max_workers=1) as save_executor:
+        final_writes = []
+        if checkpoint_interval >= 0:
+            final_writes = save(
+                trainer,
+                log_dir / "checkpoints" / "final",
+                executor=save_executor,
+                policy_checkpoint_path=last_checkpoint_path,
+            )
+        expert_stats = rollout.rollout_stats(expert_trajs)
+    for write in final_writes:
+        write.result()
 
     return {
         "imit_stats": imit_stats,
-        "expert_stats": rollout.rollout_stats(expert_trajs),
+        "expert_stats": expert_stats,
     }
 
 
@@ -3,6 +3,7 @@
 import datetime
 import functools
 import itertools
+import multiprocessing
 import os
 import pathlib
 import uuid
@@ -78,6 +79,7 @@ def make_vec_env(
     max_episode_steps: Optional[int] = None,
     post_wrappers: Optional[Sequence[Callable[[gym.Env, int], gym.Env]]] = None,
     env_make_kwargs: Optional[Mapping[str, Any]] = None,
+    forkserver_preload: bool = False,
 ) -> VecEnv:
     """Makes a vectorized environment.
 
@@ -85,7 +87,9 @@ def make_vec_env(
         env_name: The Env's string id in Gym.
         rng: The random state to use to seed the environment.
         n_envs: The number of duplicate environments.
-        parallel: If True, uses SubprocVecEnv; otherwise, DummyVecEnv.
+        parallel: If True, uses SubprocVecEnv; otherwise, DummyVecEnv. With
+            SubprocVecEnv, `n_envs` should not exceed the number of physical
+            CPU cores.
         log_dir: If specified, saves Monitor output to this directory.
         max_episode_steps: If specified, wraps each env in a TimeLimit wrapper
             with this episode length. If not specified and `max_episode_steps`
@@ -98,6 +102,12 @@ def make_vec_env(
             accepting two arguments, the Env to be wrapped and the environment index,
             and returning the wrapped Env.
         env_make_kwargs: The kwargs passed to `spec.make`.
+        forkserver_preload: If True and `parallel` is True, have the forkserver
+            import this module and the environment's module before forking the
+            workers, so that they inherit them rather than each importing them
+            (including PyTorch, via Stable Baselines) from scratch. This replaces
+            the process-wide preload list of `multiprocessing`, and has no effect
+            if the forkserver is already running.
 
     Returns:
         A VecEnv initialized with `n_envs` environments.
@@ -149,7 +159,13 @@ def make_vec_env(
         functools.partial(make_env, i, s) for i, s in enumerate(env_seeds)
     ]
     if parallel:
-        # See GH hill-a/stable-baselines issue #217
+        if forkserver_preload:
+            preload = [__name__]
+            if isinstance(spec.entry_point, str):
+                preload.append(spec.entry_point.split(":")[0])
+            multiprocessing.set_forkserver_preload(preload)
+        # We use forkserver rather than fork: see GH hill-a/stable-baselines
+        # issue #217.
         return SubprocVecEnv(env_fns, start_method="forkserver")
     else:
         return DummyVecEnv(env_fns)
@@ -227,6 +227,32 @@ def test_train_disc_step_no_crash(
     )
 
 
+def test_train_disc_autocast_no_crash(
+    _algorithm_kwargs,
+    tmpdir,
+    expert_transitions,
+    rng,
+):
+    with make_trainer(
+        _algorithm_kwargs,
+        tmpdir,
+        expert_transitions,
+        rng,
+        disc_autocast=True,
+    ) as trainer:
+        transitions = rollout.generate_transitions(
+            trainer.gen_algo,
+            trainer.venv,
+            n_timesteps=1,
+            truncate=True,
+            rng=rng,
+        )
+        stats = trainer.train_disc(
+            gen_samples=types.dataclass_quick_asdict(transitions),
+        )
+        assert np.isfinite(stats["disc_loss"])
+
+
 def test_train_gen_train_disc_no_crash(
     trainer_parametrized: common.AdversarialTrainer,
     n_updates: int = 2,
@@ -44,3 +44,23 @@ def test_validate_rewardfn_class():
     with pytest.raises(AssertionError):
         invalidated_reward_fn = serialize.ValidateRewardFn(_invalid_reward_fn)
         invalidated_reward_fn(OBS, ACTS, NEXT_OBS, DONES)
+
+
+def test_validate_reward_debug_flag(monkeypatch):
+    monkeypatch.setattr(serialize, "_DEBUG_REWARD_SHAPE", False)
+    assert serialize._validate_reward(_funky_reward_fn) is _funky_reward_fn
+
+    monkeypatch.setattr(serialize, "_DEBUG_REWARD_SHAPE", True)
+    validated_reward_fn = serialize._validate_reward(_funky_reward_fn)
+    assert isinstance(validated_reward_fn, serialize.ValidateRewardFn)
+
+
+def test_load_zero_returns_fresh_array():
+    """SB3 adds bootstrapped values to rewards in-place, so they must be writable."""
+    reward_fn = serialize.load_zero("unused", None)  # type: ignore[arg-type]
+    rews = reward_fn(OBS, ACTS, NEXT_OBS, DONES)
+    rews[0] += 1.0
+    np.testing.assert_array_equal(
+        reward_fn(OBS, ACTS, NEXT_OBS, DONES),
+        np.zeros(len(OBS)),
+    )
@@ -15,6 +15,7 @@ import shutil
 import sys
 import tempfile
 from collections import Counter
+from concurrent import futures
 from typing import Any, Dict, Generator, List, Mapping, Optional
 from unittest import mock
 
@@ -29,7 +30,9 @@ import torch as th
 from stable_baselines3.common import buffers
 from stable_baselines3.her.her_replay_buffer import HerReplayBuffer
 
+from imitation.algorithms.adversarial import gail
 from imitation.data import serialize
+from imitation.policies import serialize as policies_serialize
 from imitation.rewards import reward_nets
 from imitation.scripts import (
     analyze,
@@ -634,6 +637,88 @@ def test_train_adversarial_algorithm_value_error(tmpdir):
         )
 
 
+@pytest.fixture
+def adversarial_trainer(tmpdir, rng):
+    venv = util.make_vec_env("seals/CartPole-v0", n_envs=1, rng=rng)
+    try:
+        yield gail.GAIL(
+            venv=venv,
+            demonstrations=serialize.load(CARTPOLE_TEST_ROLLOUT_PATH),
+            demo_batch_size=32,
+            gen_algo=stable_baselines3.PPO("MlpPolicy", venv),
+            reward_net=reward_nets.BasicRewardNet(
+                venv.observation_space,
+                venv.action_space,
+            ),
+            log_dir=tmpdir,
+        )
+    finally:
+        venv.close()
+
+
+def test_train_adversarial_save_in_background(tmpdir, adversarial_trainer):
+    save_path = util.parse_path(tmpdir) / "checkpoint"
+    with futures.ThreadPoolExecutor(max_workers=1) as executor:
+        writes = train_adversarial.save(
+            adversarial_trainer,
+            save_path,
+            executor=executor,
+        )
+    assert len(writes) == 3
+    for write in writes:
+        write.result()
+
+    assert not list(save_path.glob("**/*.tmp"))
+    reward_net = th.load(save_path / "reward_train.pt", weights_only=False)
+    assert isinstance(reward_net, reward_nets.BasicRewardNet)
+    policies_serialize.load_policy(
+        "ppo",
+        adversarial_trainer.venv,
+        path=str(save_path / "gen_policy"),
+    )
+
+
+def test_train_adversarial_save_links_policy(tmpdir, adversarial_trainer):
+    checkpoints_path = util.parse_path(tmpdir) / "checkpoints"
+    round_path = checkpoints_path / "00001"
+    train_adversarial.save(adversarial_trainer, round_path)
+    final_path = checkpoints_path / "final"
+    train_adversarial.save(
+        adversarial_trainer,
+        final_path,
+        policy_checkpoint_path=round_path,
+    )
+
+    model_path = final_path / "gen_policy" / "model.zip"
+    round_model_path = round_path / "gen_policy" / "model.zip"
+    assert os.path.samefile(model_path, round_model_path)
+    assert (final_path / "reward_train.pt").is_file()
+
+    # Saving the round again replaces its file, rather than modifying the linked one.
+    train_adversarial.save(adversarial_trainer, round_path)
+    assert not os.path.samefile(model_path, round_model_path)
+
+    # The final policy stays loadable after the round's checkpoint is deleted.
+    shutil.rmtree(round_path)
+    policies_serialize.load_policy(
+        "ppo",
+        adversarial_trainer.venv,
+        path=str(final_path / "gen_policy"),
+    )
+
+
+def test_train_adversarial_check_finished_writes():
+    pending: futures.Future = futures.Future()
+    done: futures.Future = futures.Future()
+    done.set_result(None)
+    assert train_adversarial._check_finished_writes([pending, done]) == [pending]
+
+    failed: futures.Future = futures.Future()
+    failed.set_exception(OSError("No space left on device"))
+    with pytest.raises(OSError, match="No space left"):
+        train_adversarial._check_finished_writes([pending, failed])
+
+
 def test_transfer_learning(tmpdir: str) -> None:
     """Transfer learning smoke test.
 
@@ -320,6 +320,21 @@ def test_regularizer_update_params(
     )
 
 
+def test_regularizer_update_params_no_updater(
+    initial_lambda,
+    hierarchical_logger,
+    simple_optimizer,
+):
+    regularizer = SimpleRegularizer(
+        initial_lambda=initial_lambda,
+        logger=hierarchical_logger,
+        lambda_updater=None,
+        optimizer=simple_optimizer,
+    )
+    regularizer.update_params(th.tensor(1.0), th.tensor(10.0))
+    assert regularizer.lambda_ == initial_lambda
+
+
 class SimpleLossRegularizer(regularizers.LossRegularizer):
     """A simple loss regularizer.
 
@@ -363,6 +378,36 @@ def test_loss_regularizer(
     assert th.allclose(loss_param.grad, train_loss_base * (initial_lambda + 1))
 
 
+def test_loss_regularizer_log_every(hierarchical_logger, simple_optimizer):
+    regularizer = SimpleLossRegularizer(
+        initial_lambda=1.0,
+        logger=hierarchical_logger,
+        lambda_updater=None,
+        optimizer=simple_optimizer,
+        log_every=2,
+    )
+    loss_param = simple_optimizer.param_groups[0]["params"][0]
+    logged_losses = []
+    for train_loss_base in [1.0, 2.0, 3.0]:
+        regularizer.optimizer.zero_grad()
+        regularizer.regularize_and_backward(train_loss_base * loss_param)
+        logged_losses.append(
+            hierarchical_logger.default_logger.name_to_value["regularized_loss"],
+        )
+    expected_losses = [2 * base * loss_param.item() for base in [1.0, 1.0, 3.0]]
+    assert np.allclose(logged_losses, expected_losses)
+
+    for log_every in [0, 1.5]:
+        with pytest.raises(ValueError, match="log_every must be a positive integer"):
+            SimpleLossRegularizer(
+                initial_lambda=1.0,
+                logger=hierarchical_logger,
+                lambda_updater=None,
+                optimizer=simple_optimizer,
+                log_every=log_every,
+            )
+
+
 class SimpleWeightRegularizer(regularizers.WeightRegularizer):
     """A simple weight regularizer.
 
@@ -494,6 +539,33 @@ def test_lp_regularizer(
         )
 
 
+@pytest.mark.parametrize("foreach_autograd", [False, True])
+@pytest.mark.parametrize("p", [1, 2, 3, 4])
+def test_lp_regularizer_gradient(hierarchical_logger, monkeypatch, foreach_autograd, p):
+    """The Lp penalty has the same gradient as a per-parameter `vector_norm`."""
+    if foreach_autograd and not regularizers._FOREACH_AUTOGRAD:
+        pytest.skip("foreach ops do not support autograd in this torch version")
+    monkeypatch.setattr(regularizers, "_FOREACH_AUTOGRAD", foreach_autograd)
+    gen = th.Generator().manual_seed(0)
+    params = [
+        th.randn(shape, generator=gen, requires_grad=True) for shape in [(3, 4), (5,)]
+    ]
+    regularizer = regularizers.LpRegularizer(
+        initial_lambda=0.5,
+        logger=hierarchical_logger,
+        lambda_updater=None,
+        optimizer=th.optim.SGD(params, lr=0.1),
+        p=p,
+    )
+    regularizer.regularize_and_backward(th.tensor(0.0, requires_grad=True))
+    expected_penalty = 0.5 * sum(
+        th.linalg.vector_norm(param, ord=p).pow(p) for param in params
+    )
+    expected_grads = th.autograd.grad(expected_penalty, params)
+    for param, expected_grad in zip(params, expected_grads):
+        assert th.allclose(param.grad, expected_grad)
+
+
 @pytest.mark.parametrize(
     "train_loss_base",
     [
@@ -526,3 +598,33 @@ def test_weight_decay_regularizer(
             initial_weight_value * (1 - lr * initial_lambda),
         )
         assert th.allclose(weight.grad, train_loss_base * initial_weight_value)
+
+
+def test_regularizers_skip_zero_lambda(
+    hierarchical_logger,
+    multi_param_and_lr_optimizer,
+    interval_param_scaler,
+):
+    params = multi_param_and_lr_optimizer.param_groups[0]["params"]
+    initial_weight_values = [param.data.clone() for param in params]
+    for regularizer_cls, kwargs in [
+        (regularizers.LpRegularizer, dict(p=2)),
+        (regularizers.WeightDecayRegularizer, {}),
+    ]:
+        regularizer = regularizer_cls(
+            initial_lambda=1.0,
+            logger=hierarchical_logger,
+            lambda_updater=interval_param_scaler,
+            optimizer=multi_param_and_lr_optimizer,
+            val_split=0.1,
+            **kwargs,
+        )
+        regularizer.lambda_ = 0.0
+        regularizer.optimizer.zero_grad()
+        train_loss = sum(th.pow(param, 2) / 2 for param in params)
+        regularized_loss = regularizer.regularize_and_backward(train_loss)
+        if regularized_loss is not None:
+            assert th.allclose(regularized_loss, train_loss)
+        for param, initial_weight_value in zip(params, initial_weight_values):
+            assert th.allclose(param.data, initial_weight_value)
+            assert th.allclose(param.grad, initial_weight_value)